@@ -0,0 +1,46 @@
+"""
+Regression tests for the markdown cheatsheet validator.
+
+Run from the src directory:
+    python -m unittest utilities.test_validate_markdown
+"""
+
+from pathlib import Path
+import tempfile
+import unittest
+
+from utilities.validate_markdown import MarkdownValidator
+
+
+class MarkdownValidatorTest(unittest.TestCase):
+    """Tests for MarkdownValidator."""
+
+    def validate(self, data: bytes) -> MarkdownValidator:
+        """
+        Validate markdown content written to a temporary file.
+
+        Args:
+            data: Raw file content
+
+        Returns:
+            The validator after running all checks
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / 'sample.md'
+            file_path.write_bytes(data)
+            validator = MarkdownValidator(file_path)
+            validator.validate()
+        return validator
+
+    def test_non_ascii_whitespace_only_lines(self):
+        """Lines of odd-length non-ASCII whitespace are not list items."""
+        for line in (b'\xc2\xa0', ' '.encode('utf-8'), b'  \x1c'):
+            with self.subTest(line=line):
+                validator = self.validate(b'# T\n' + line + b'\n')
+                self.assertEqual(validator.errors, [])
+                codes = [code for _, code, _ in validator.warnings]
+                self.assertNotIn('LIST_INDENT', codes)
+
+
+if __name__ == "__main__":
+    unittest.main()
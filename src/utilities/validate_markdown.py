@@ -8,49 +8,138 @@ follow the required format and structure conventions.
 Usage:
     python validate_markdown.py [file_path]
     python validate_markdown.py --all
+    python validate_markdown.py --all --fail-fast
     python validate_markdown.py --help
 """
 
 import argparse
+import bisect
+from collections import deque
+from collections.abc import Iterable, Iterator
+from functools import partial
+import json
+import math
+import os
 from pathlib import Path
 import re
 import sys
-from typing import Tuple
+
+_LINK_RE = re.compile(rb'\[([^\]\n]+)\]\(([^)\n]*)\)')
+
+_WHITESPACE_BYTES = b' \t\x0b\x0c'
+_INDENT_BYTES = b' \t\x0b\x0c\x1c\x1d\x1e\x1f'
+_BACKTICK = ord('`')
+_HASH = ord('#')
+
+CACHE_FILE = '.validate_markdown.cache'
+
+_POOL_MIN_FILES = 256
+_POOL_CHUNKSIZE = 4
+
+_MSG = {
+    'FILE_NOT_FOUND': "File not found: {0}",
+    'READ_ERROR': "Error reading file: {0}",
+    'NO_H1': "File should start with H1 title (# Title)",
+    'EMPTY_H1': "H1 title is empty",
+    'NO_TOC': "No 'Table of Contents' section found in first 20 lines",
+    'TRAILING_WS': "Trailing whitespace detected",
+    'BLANK_LINES': "More than 2 consecutive blank lines",
+    'NO_CODE_LANG': "Code block without language identifier",
+    'UNCLOSED_CODE': "Unclosed code block",
+    'EMPTY_HEADING': "Empty heading found",
+    'HEADING_SKIP': "Heading level skipped (H{0} -> H{1})",
+    'LIST_INDENT': "Inconsistent list indentation (should be multiples of 2 spaces)",
+    'EMPTY_LINK_TEXT': "Empty link text",
+    'EMPTY_LINK_URL': "Empty link URL",
+}
+
+Issue = tuple[int | None, str, tuple | None]
+
+
+def _issue_line(issue: Issue) -> int:
+    """
+    Sort key placing file-level issues first, then issues by line number.
+
+    Args:
+        issue: Tuple of (line number or None, message code, format arguments)
+
+    Returns:
+        The issue's line number, or 0 for file-level issues
+    """
+    return issue[0] or 0
+
+
+def _format_issue(issue: Issue) -> str:
+    """
+    Render a recorded issue as a report message.
+
+    Args:
+        issue: Tuple of (line number or None, message code, format arguments)
+
+    Returns:
+        Human-readable message, prefixed with the line number if there is one
+    """
+    line_no, code, extra = issue
+    message = _MSG[code].format(*extra) if extra else _MSG[code]
+    if line_no is None:
+        return message
+    return f"Line {line_no}: {message}"
 
 
 class MarkdownValidator:
     """Validates markdown files against cheatsheet standards."""
 
-    def __init__(self, file_path: Path):
+    def __init__(
+        self,
+        file_path: Path,
+        fail_fast: bool = False,
+        data: bytes | None = None,
+    ):
         """
         Initialize the validator with a markdown file path.
 
         Args:
             file_path: Path to the markdown file to validate
+            fail_fast: Stop at the first check that reports an error and
+                skip warning-only checks
+            data: Contents of the file if already read by the caller
         """
         self.file_path = file_path
-        self.content = ""
-        self.lines = []
-        self.errors = []
-        self.warnings = []
+        self.fail_fast = fail_fast
+        self._data = data
+        self._raw = b""
+        self._raw_lines = []
+        self._line_starts = []
+        self.errors: list[Issue] = []
+        self.warnings: list[Issue] = []
 
     def read_file(self) -> bool:
         """
         Read the markdown file content.
 
+        The file is kept as raw UTF-8 bytes only; individual lines are
+        decoded when a check needs text. Data passed to the constructor is
+        used instead of reading the file again.
+
         Returns:
             True if file was read successfully, False otherwise
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
-                self.lines = self.content.split('\n')
+            raw = self._data
+            self._data = None
+            if raw is None:
+                raw = self.file_path.read_bytes()
+            if b'\r' in raw:
+                raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            raw.decode('utf-8')  # reject invalid UTF-8 before any check runs
+            self._raw = raw
+            self._raw_lines = raw.split(b'\n')
             return True
         except FileNotFoundError:
-            self.errors.append(f"File not found: {self.file_path}")
+            self.errors.append((None, 'FILE_NOT_FOUND', (self.file_path,)))
             return False
         except Exception as e:
-            self.errors.append(f"Error reading file: {str(e)}")
+            self.errors.append((None, 'READ_ERROR', (str(e),)))
             return False
 
     def validate_h1_title(self) -> None:
@@ -59,16 +148,13 @@ class MarkdownValidator:
 
         The first non-empty line should be an H1 heading.
         """
-        for i, line in enumerate(self.lines):
+        for i, raw_line in enumerate(self._raw_lines):
+            line = raw_line.decode('utf-8')
             if line.strip():
                 if not line.startswith('# '):
-                    self.errors.append(
-                        f"Line {i + 1}: File should start with H1 title (# Title)"
-                    )
+                    self.errors.append((i + 1, 'NO_H1', None))
                 elif line.strip() == '#':
-                    self.errors.append(
-                        f"Line {i + 1}: H1 title is empty"
-                    )
+                    self.errors.append((i + 1, 'EMPTY_H1', None))
                 break
 
     def validate_table_of_contents(self) -> None:
@@ -77,187 +163,229 @@ class MarkdownValidator:
 
         The TOC should appear early in the document and use proper heading.
         """
-        toc_pattern = re.compile(r'^## Table of Contents', re.IGNORECASE)
-        has_toc = any(toc_pattern.match(line) for line in self.lines[:20])
+        raw = self._raw
+        end = -1
+        for _ in range(20):
+            end = raw.find(b'\n', end + 1)
+            if end == -1:
+                end = len(raw)
+                break
+
+        head = raw[:end].lower()
+        has_toc = (
+            head.startswith(b'## table of contents')
+            or b'\n## table of contents' in head
+        )
 
         if not has_toc:
-            self.warnings.append(
-                "No 'Table of Contents' section found in first 20 lines"
-            )
+            self.warnings.append((None, 'NO_TOC', None))
 
-    def validate_headings_hierarchy(self) -> None:
+    def _validate_lines_single_pass(
+        self, check_errors: bool = True, check_warnings: bool = True
+    ) -> None:
         """
-        Validate proper heading hierarchy.
+        Run all per-line checks in a single pass over the file.
+
+        Covers heading hierarchy, empty headings, code blocks, trailing
+        whitespace, consecutive blank lines and list formatting.
 
-        Ensures headings follow proper nesting (H1 -> H2 -> H3, etc.)
-        without skipping levels.
+        Args:
+            check_errors: Record issues that fail validation
+            check_warnings: Record warning-only issues
         """
-        heading_pattern = re.compile(r'^(#{1,6})\s+(.+)')
-        previous_level = 0
+        errors_append = self.errors.append
+        warnings_append = self.warnings.append
 
-        for i, line in enumerate(self.lines):
-            match = heading_pattern.match(line)
-            if match:
-                current_level = len(match.group(1))
+        in_code_block = False
+        code_block_start = -1
+        blank_count = 0
+        previous_level = 0
 
-                if current_level > previous_level + 1 and previous_level > 0:
-                    self.warnings.append(
-                        f"Line {i + 1}: Heading level skipped "
-                        f"(H{previous_level} -> H{current_level})"
-                    )
+        for i, raw_line in enumerate(self._raw_lines):
+            if check_warnings and raw_line and raw_line[-1] in _WHITESPACE_BYTES:
+                warnings_append((i + 1, 'TRAILING_WS', None))
+
+            if not raw_line or raw_line.isspace():
+                if check_warnings:
+                    blank_count += 1
+                    if blank_count > 2:
+                        warnings_append((i + 1, 'BLANK_LINES', None))
+                continue
+
+            blank_count = 0
+            first = raw_line[0]
+
+            if first == _BACKTICK:
+                if raw_line.startswith(b'```'):
+                    if not in_code_block:
+                        in_code_block = True
+                        code_block_start = i
+
+                        if (
+                            check_warnings
+                            and raw_line.decode('utf-8').strip() == '```'
+                        ):
+                            warnings_append((i + 1, 'NO_CODE_LANG', None))
+                    else:
+                        in_code_block = False
+
+            elif first == _HASH:
+                line = raw_line.decode('utf-8')
+                level = len(line) - len(line.lstrip('#'))
+
+                if level <= 6:
+                    rest = line[level:]
+
+                    if check_errors and (not rest or rest.isspace()):
+                        errors_append((i + 1, 'EMPTY_HEADING', None))
+
+                    if check_warnings and len(rest) > 1 and rest[0].isspace():
+                        if level > previous_level + 1 and previous_level > 0:
+                            warnings_append(
+                                (i + 1, 'HEADING_SKIP', (previous_level, level))
+                            )
+
+                        previous_level = level
+
+            elif check_warnings and (first in _INDENT_BYTES or first >= 0x80):
+                line = raw_line.decode('utf-8')
+                rest = line.lstrip()
+                indent = len(line) - len(rest)
+
+                if indent & 1 and rest:
+                    marker_end = 0
+                    if rest[0] in '-*+':
+                        marker_end = 1
+                    elif rest[0].isdecimal():
+                        j = 1
+                        while j < len(rest) and rest[j].isdecimal():
+                            j += 1
+                        if rest[j:j + 1] == '.':
+                            marker_end = j + 1
+
+                    if (
+                        marker_end
+                        and rest[marker_end:marker_end + 1].isspace()
+                        and len(rest) > marker_end + 1
+                    ):
+                        warnings_append((i + 1, 'LIST_INDENT', None))
+
+        if check_errors and in_code_block:
+            errors_append((code_block_start + 1, 'UNCLOSED_CODE', None))
+
+    def _line_number(self, offset: int) -> int:
+        """
+        Map a byte offset in the file to its line number.
 
-                previous_level = current_level
+        The line-start table is only built the first time it is needed.
 
-    def validate_code_blocks(self) -> None:
-        """
-        Validate code blocks are properly formatted.
+        Args:
+            offset: Byte offset into the raw file content
 
-        Ensures code blocks use proper fenced syntax with language identifiers.
+        Returns:
+            1-based line number containing the offset
         """
-        in_code_block = False
-        code_block_start = -1
+        if not self._line_starts:
+            raw = self._raw
+            line_starts = self._line_starts = [0]
+            append = line_starts.append
+            pos = raw.find(b'\n')
+            while pos != -1:
+                append(pos + 1)
+                pos = raw.find(b'\n', pos + 1)
 
-        for i, line in enumerate(self.lines):
-            if line.startswith('```'):
-                if not in_code_block:
-                    in_code_block = True
-                    code_block_start = i
-
-                    if line.strip() == '```':
-                        self.warnings.append(
-                            f"Line {i + 1}: Code block without language identifier"
-                        )
-                else:
-                    in_code_block = False
-
-        if in_code_block:
-            self.errors.append(
-                f"Line {code_block_start + 1}: Unclosed code block"
-            )
+        return bisect.bisect_right(self._line_starts, offset)
 
     def validate_links(self) -> None:
         """
         Validate markdown links are properly formatted.
 
-        Checks for broken link syntax and missing URLs.
+        Checks for broken link syntax and missing URLs. The whole document is
+        scanned in one regex pass and matches are mapped back to line numbers.
         """
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]*)\)')
-
-        for i, line in enumerate(self.lines):
-            matches = link_pattern.finditer(line)
-            for match in matches:
-                link_text = match.group(1)
-                link_url = match.group(2)
-
-                if not link_text:
-                    self.errors.append(
-                        f"Line {i + 1}: Empty link text"
-                    )
+        raw = self._raw
+        if b'](' not in raw:
+            return
 
-                if not link_url:
-                    self.errors.append(
-                        f"Line {i + 1}: Empty link URL"
-                    )
+        for match in _LINK_RE.finditer(raw):
+            text_start, text_end = match.span(1)
+            url_start, url_end = match.span(2)
 
-    def validate_empty_headings(self) -> None:
-        """
-        Validate that headings are not empty.
-
-        Ensures all heading lines contain actual text content.
-        """
-        heading_pattern = re.compile(r'^(#{1,6})\s*$')
+            if text_start == text_end:
+                self.errors.append(
+                    (self._line_number(text_start), 'EMPTY_LINK_TEXT', None)
+                )
 
-        for i, line in enumerate(self.lines):
-            if heading_pattern.match(line):
+            if url_start == url_end:
                 self.errors.append(
-                    f"Line {i + 1}: Empty heading found"
+                    (self._line_number(url_start), 'EMPTY_LINK_URL', None)
                 )
 
-    def validate_trailing_whitespace(self) -> None:
+    def validate_errors_only(self) -> bool:
         """
-        Check for trailing whitespace on lines.
+        Run the checks that can fail validation on the file already read.
 
-        Trailing whitespace can cause rendering issues in some markdown parsers.
-        """
-        for i, line in enumerate(self.lines):
-            if line != line.rstrip():
-                self.warnings.append(
-                    f"Line {i + 1}: Trailing whitespace detected"
-                )
+        With fail_fast set, returns as soon as a check reports an error.
 
-    def validate_consecutive_blank_lines(self) -> None:
+        Returns:
+            True if no errors were found, False otherwise
         """
-        Check for excessive consecutive blank lines.
+        self.validate_h1_title()
+        if self.fail_fast and self.errors:
+            return False
 
-        More than 2 consecutive blank lines may indicate formatting issues.
-        """
-        blank_count = 0
+        self._validate_lines_single_pass(check_warnings=False)
+        if self.fail_fast and self.errors:
+            return False
 
-        for i, line in enumerate(self.lines):
-            if not line.strip():
-                blank_count += 1
-                if blank_count > 2:
-                    self.warnings.append(
-                        f"Line {i + 1}: More than 2 consecutive blank lines"
-                    )
-            else:
-                blank_count = 0
-
-    def validate_list_formatting(self) -> None:
-        """
-        Validate list formatting consistency.
+        self.validate_links()
+
+        return len(self.errors) == 0
 
-        Checks for proper list markers and indentation.
+    def validate_warnings(self) -> None:
+        """
+        Run the warning-only checks on the file already read.
         """
-        unordered_pattern = re.compile(r'^(\s*)([-*+])\s+(.+)')
-        ordered_pattern = re.compile(r'^(\s*)(\d+\.)\s+(.+)')
-
-        for i, line in enumerate(self.lines):
-            unordered_match = unordered_pattern.match(line)
-            ordered_match = ordered_pattern.match(line)
-
-            if unordered_match:
-                indent = unordered_match.group(1)
-                if len(indent) % 2 != 0:
-                    self.warnings.append(
-                        f"Line {i + 1}: Inconsistent list indentation "
-                        f"(should be multiples of 2 spaces)"
-                    )
-
-            if ordered_match:
-                indent = ordered_match.group(1)
-                if len(indent) % 2 != 0:
-                    self.warnings.append(
-                        f"Line {i + 1}: Inconsistent list indentation "
-                        f"(should be multiples of 2 spaces)"
-                    )
-
-    def validate(self) -> bool:
+        self.validate_table_of_contents()
+        self._validate_lines_single_pass(check_errors=False)
+
+    def validate(self, warnings: bool = True) -> bool:
         """
         Run all validation checks on the markdown file.
 
+        Warning-only checks always run for a failing file so its report is
+        complete, and never run in fail-fast mode.
+
+        Args:
+            warnings: Also run the warning-only checks when the file passes
+
         Returns:
             True if validation passed with no errors, False otherwise
         """
         if not self.read_file():
             return False
 
-        self.validate_h1_title()
-        self.validate_table_of_contents()
-        self.validate_headings_hierarchy()
-        self.validate_code_blocks()
-        self.validate_links()
-        self.validate_empty_headings()
-        self.validate_trailing_whitespace()
-        self.validate_consecutive_blank_lines()
-        self.validate_list_formatting()
+        if warnings and not self.fail_fast:
+            self.validate_h1_title()
+            self.validate_table_of_contents()
+            self._validate_lines_single_pass()
+            self.validate_links()
+            return len(self.errors) == 0
 
-        return len(self.errors) == 0
+        is_valid = self.validate_errors_only()
+
+        if not is_valid and not self.fail_fast:
+            self.validate_warnings()
+
+        return is_valid
 
     def get_report(self) -> str:
         """
         Generate a validation report.
 
+        Errors and warnings are each listed in line order, with file-level
+        issues first, regardless of which check found them.
+
         Returns:
             Formatted string containing errors and warnings
         """
@@ -271,13 +399,13 @@ class MarkdownValidator:
         else:
             if self.errors:
                 report_lines.append(f"\nERRORS ({len(self.errors)}):")
-                for error in self.errors:
-                    report_lines.append(f"  - {error}")
+                for error in sorted(self.errors, key=_issue_line):
+                    report_lines.append(f"  - {_format_issue(error)}")
 
             if self.warnings:
                 report_lines.append(f"\nWARNINGS ({len(self.warnings)}):")
-                for warning in self.warnings:
-                    report_lines.append(f"  - {warning}")
+                for warning in sorted(self.warnings, key=_issue_line):
+                    report_lines.append(f"  - {_format_issue(warning)}")
 
             status = "FAILED" if self.errors else "PASSED (with warnings)"
             report_lines.append(f"\nStatus: {status}")
@@ -286,33 +414,158 @@ class MarkdownValidator:
         return "\n".join(report_lines)
 
 
-def validate_single_file(file_path: Path) -> bool:
+def _validate_one(
+    md_file: Path,
+    fail_fast: bool = False,
+    data: bytes | None = None,
+    show_warnings: bool = False,
+) -> tuple[Path, bool, str]:
     """
-    Validate a single markdown file.
+    Validate a single markdown file for validate_all_files.
+
+    Kept at module level so it can be sent to worker processes; only the
+    outcome travels back, with the report rendered only when it will be
+    printed.
 
     Args:
-        file_path: Path to the markdown file
+        md_file: Path to the markdown file
+        fail_fast: Stop at the first check that reports an error
+        data: Contents of the file if already read
+        show_warnings: Run warning-only checks for passing files and report
+            any warnings found
 
     Returns:
-        True if validation passed, False otherwise
+        Tuple of (md_file, is_valid, report)
     """
-    validator = MarkdownValidator(file_path)
-    is_valid = validator.validate()
-    print(validator.get_report())
-    return is_valid
+    validator = MarkdownValidator(md_file, fail_fast, data)
+    is_valid = validator.validate(warnings=show_warnings)
+    if is_valid and not validator.warnings:
+        return md_file, is_valid, ""
+    return md_file, is_valid, validator.get_report()
 
 
-def validate_all_files(cheatsheets_dir: Path) -> Tuple[int, int, int]:
+def _read_ahead(
+    md_files: Iterable[Path], depth: int = 16
+) -> Iterator[tuple[Path, bytes | None]]:
+    """
+    Read files in background threads, keeping up to depth reads in flight.
+
+    Files are yielded in input order so reading the next files overlaps with
+    validating the current one.
+
+    Args:
+        md_files: Paths of the files to read
+        depth: Maximum number of files read ahead of the consumer
+
+    Yields:
+        Tuple of (md_file, data), with data None if the read failed so the
+        validator can report the error itself
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def read(md_file: Path) -> bytes | None:
+        try:
+            return md_file.read_bytes()
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        in_flight = deque()
+        for md_file in md_files:
+            in_flight.append((md_file, executor.submit(read, md_file)))
+            if len(in_flight) >= depth:
+                md_file, future = in_flight.popleft()
+                yield md_file, future.result()
+
+        while in_flight:
+            md_file, future = in_flight.popleft()
+            yield md_file, future.result()
+
+
+def _validator_stamp() -> int:
+    """
+    Identify the current version of this script for cache invalidation.
+
+    Returns:
+        Modification time of this file in nanoseconds
+    """
+    return Path(__file__).stat().st_mtime_ns
+
+
+def _load_cache(cache_file: Path) -> dict[str, list[int]]:
+    """
+    Load the results of a previous validate_all_files run.
+
+    Args:
+        cache_file: Path to the JSON cache file
+
+    Returns:
+        Mapping of file path to the [mtime_ns, size] it last passed with, or
+        an empty dict if the cache is missing, unreadable, malformed or stale
+    """
+    try:
+        data = json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('validator') != _validator_stamp():
+        return {}
+
+    files = data.get('files')
+    if not isinstance(files, dict):
+        return {}
+
+    return files
+
+
+def _save_cache(cache_file: Path, files: dict[str, list[int]]) -> None:
+    """
+    Write the files that passed validation to the cache.
+
+    Args:
+        cache_file: Path to the JSON cache file
+        files: Mapping of file path to the [mtime_ns, size] it passed with
+    """
+    data = {'validator': _validator_stamp(), 'files': files}
+    try:
+        cache_file.write_text(json.dumps(data), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def validate_all_files(
+    cheatsheets_dir: Path,
+    fail_fast: bool = False,
+    cache_file: Path | None = None,
+    show_warnings: bool = False,
+) -> tuple[int, int, int]:
     """
     Validate all markdown files in the cheatsheets directory.
 
+    Runs of at least _POOL_MIN_FILES files are validated in parallel worker
+    processes when more than one CPU is available. Smaller runs stay
+    in-process, where pool start-up would cost more than it saves, and read
+    files ahead in background threads while the current one is validated.
+    When a cache file is given, files whose modification time and size match
+    a previous passing run are not validated again. Warning-only checks run
+    just for failing files unless show_warnings is set. All output is written
+    to stdout in a single call once every file has been validated.
+
     Args:
         cheatsheets_dir: Path to the cheatsheets directory
+        fail_fast: Stop each file at the first check that reports an error
+        cache_file: Path to the JSON cache of previously passing files
+        show_warnings: Also report warnings for files that pass; every file
+            is validated again since the cache only records pass/fail
 
     Returns:
         Tuple of (total_files, passed_files, failed_files)
     """
-    md_files = list(cheatsheets_dir.glob("*.md"))
+    with os.scandir(cheatsheets_dir) as entries:
+        md_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.md') and entry.is_file()
+        )
 
     if not md_files:
         print(f"No markdown files found in {cheatsheets_dir}")
@@ -322,24 +575,74 @@ def validate_all_files(cheatsheets_dir: Path) -> Tuple[int, int, int]:
     passed_files = 0
     failed_files = 0
 
-    print(f"\nValidating {total_files} markdown files...\n")
+    out = [f"\nValidating {total_files} markdown files...\n"]
+
+    cached = {}
+    file_keys = {}
+    pending = md_files
+
+    if cache_file is not None:
+        cached = _load_cache(cache_file)
+        for md_file in md_files:
+            try:
+                stat = md_file.stat()
+            except OSError:
+                continue
+            file_keys[str(md_file)] = [stat.st_mtime_ns, stat.st_size]
+        if not show_warnings:
+            pending = [
+                md_file for md_file in md_files
+                if str(md_file) not in file_keys
+                or cached.get(str(md_file)) != file_keys[str(md_file)]
+            ]
+
+    workers = min(
+        os.cpu_count() or 1, math.ceil(len(pending) / _POOL_CHUNKSIZE)
+    )
 
-    for md_file in sorted(md_files):
-        validator = MarkdownValidator(md_file)
-        is_valid = validator.validate()
+    if workers > 1 and len(pending) >= _POOL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        validate_one = partial(
+            _validate_one, fail_fast=fail_fast, show_warnings=show_warnings
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(validate_one, pending, chunksize=_POOL_CHUNKSIZE)
+            )
+    else:
+        results = [
+            _validate_one(md_file, fail_fast, data, show_warnings)
+            for md_file, data in _read_ahead(pending)
+        ]
+
+    outcomes = {md_file: (is_valid, report) for md_file, is_valid, report in results}
+    passed_keys = {}
+
+    for md_file in md_files:
+        is_valid, report = outcomes.get(md_file, (True, ""))
+
+        if is_valid and str(md_file) in file_keys:
+            passed_keys[str(md_file)] = file_keys[str(md_file)]
 
         if is_valid:
             passed_files += 1
-            print(f"✓ {md_file.name}: PASSED")
+            out.append(f"✓ {md_file.name}: PASSED")
+            if report:
+                out.append(report)
         else:
             failed_files += 1
-            print(f"✗ {md_file.name}: FAILED")
-            print(validator.get_report())
+            out.append(f"✗ {md_file.name}: FAILED")
+            out.append(report)
 
-    print("\n" + "=" * 70)
-    print(f"Summary: {passed_files}/{total_files} files passed validation")
-    print(f"Failed: {failed_files}")
-    print("=" * 70)
+    if cache_file is not None:
+        _save_cache(cache_file, passed_keys)
+
+    out.append("\n" + "=" * 70)
+    out.append(f"Summary: {passed_files}/{total_files} files passed validation")
+    out.append(f"Failed: {failed_files}")
+    out.append("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
 
     return total_files, passed_files, failed_files
 
@@ -361,6 +664,12 @@ Examples:
   Validate all cheatsheet files:
     python validate_markdown.py --all
 
+  Stop each file at its first error (CI gating):
+    python validate_markdown.py --all --fail-fast
+
+  Validate all files and print warnings for passing files too:
+    python validate_markdown.py --all --show-warnings
+
   Get help:
     python validate_markdown.py --help
         """
@@ -379,6 +688,25 @@ Examples:
         help='Validate all markdown files in the cheatsheets directory'
     )
 
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first failing check and skip warning-only checks'
+    )
+
+    parser.add_argument(
+        '--show-warnings',
+        action='store_true',
+        help='With --all, also print warnings for files that pass'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Revalidate every file instead of skipping unchanged files '
+             f'recorded in {CACHE_FILE}'
+    )
+
     args = parser.parse_args()
 
     if args.all:
@@ -389,7 +717,10 @@ Examples:
             print(f"Error: Cheatsheets directory not found: {cheatsheets_dir}")
             sys.exit(1)
 
-        total, passed, failed = validate_all_files(cheatsheets_dir)
+        cache_file = None if args.no_cache else Path(CACHE_FILE)
+        total, passed, failed = validate_all_files(
+            cheatsheets_dir, args.fail_fast, cache_file, args.show_warnings
+        )
         sys.exit(0 if failed == 0 else 1)
 
     elif args.file:
@@ -403,7 +734,9 @@ Examples:
             print(f"Error: File is not a markdown file: {file_path}")
             sys.exit(1)
 
-        is_valid = validate_single_file(file_path)
+        validator = MarkdownValidator(file_path, args.fail_fast)
+        is_valid = validator.validate()
+        print(validator.get_report())
         sys.exit(0 if is_valid else 1)
 
     else: